@@ -194,7 +194,7 @@ class Elaborator:
             # Format: `  Module          MyModule      `
             s_name = s.name or ""
             # Filter out None-valued names, common during elaboration errors.
-            line = "  " + type(s).__name__.ljust(14) + s_name.ljust(28)
+            location = ""  # Source file and line-number, if available
 
             source_info = getattr(s, "_source_info", None)
             if source_info is not None:
@@ -214,8 +214,8 @@ class Elaborator:
 
                 # Format: /path/to/file.py:123
                 # Serves as a clickable link in popular IDEs.
-                line += f"{str(filepath)}:{source_info.linenum}"
+                location = f"{filepath}:{source_info.linenum}"
 
-            line += "\n"
-            lines.append(line)
+            # Format: `  Module          MyModule      /path/to/file.py:123`
+            lines.append(f"  {type(s).__name__:<14}{s_name:<28}{location}\n")
         return lines
@@ -103,7 +103,7 @@ class GeneratorElaborator(Elaborator):
             # Then add a unique suffix per its parameter-values
             # Note this part may require that `m` has been through elaboration above!
             if not isinstance(call.params, HasNoParams):
-                m.name += "(" + _unique_name(call.params) + ")"
+                m.name = f"{m.name}({_unique_name(call.params)})"
 
         # Generators may return other (potentially nested) generator-calls; recursively unwind any of them
         # Note this should hit Python's recursive stack-check if it doesn't terminate
@@ -157,12 +157,13 @@ def _resolve_concat(conc: Concat) -> Concat:
         return Concat(*(first + rest.parts))
 
     # Otherwise peel off as many Signals and concrete-Signal Slices as we can
-    for idx in range(len(conc.parts)):
-        if _flat_concatable(conc.parts[idx]):
+    parts = conc.parts
+    for idx, part in enumerate(parts):
+        if _flat_concatable(part):
             continue
         # Hit our first "compound" entry. Split the list here.
-        first = conc.parts[:idx]
-        rest = _resolve_concat(Concat(*conc.parts[idx:]))
+        first = parts[:idx]
+        rest = _resolve_concat(Concat(*parts[idx:]))
         return Concat(*(first + rest.parts))
 
     raise RuntimeError("Unable to resolve concatenation")
@@ -160,8 +160,7 @@ def compile(
             raise RuntimeError("No PDK modules registered")
 
         msg = f"Multiple ({len(_mgr.modules)}) PDK modules registered: [\n"
-        for m in _mgr.modules:
-            msg += "\t" + str(m) + "\n"
+        msg += "".join(f"\t{m}\n" for m in _mgr.modules)
         msg += "] \n"
         msg += f"Set one as the default via `hdl21.pdk.set_default()` (or remove all others) to use `h.pdk.compile()`."
         raise RuntimeError(msg)
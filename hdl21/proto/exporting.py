@@ -12,12 +12,10 @@ free-standing functions to enable use elsewhere.
 """
 
 from decimal import Decimal
-from dataclasses import fields
+from dataclasses import dataclass, fields
 from enum import Enum
 from typing import Optional, List, Union, Dict, Any
 
-from pydantic.dataclasses import dataclass
-
 # Local imports
 # Proto-definitions
 import vlsir
@@ -57,8 +55,26 @@ def to_proto(
     return exporter.export()
 
 
+# Mapping from Hdl21 ideal-element Primitive names to their `vlsir.primitives` equivalents
+_VLSIR_PRIMITIVE_NAMES = {
+    "DcVoltageSource": "vdc",
+    "PulseVoltageSource": "vpulse",
+    "SineVoltageSource": "vsin",
+    "CurrentSource": "isource",
+    "IdealResistor": "resistor",
+    "IdealCapacitor": "capacitor",
+    "IdealInductor": "inductor",
+    "VoltageControlledVoltageSource": "vcvs",
+    "CurrentControlledVoltageSource": "ccvs",
+    "VoltageControlledCurrentSource": "vccs",
+    "CurrentControlledCurrentSource": "cccs",
+}
+
+
 @dataclass
 class ModuleMapping:
+    """Mapping between an `hdl21.Module` and its exported VLSIR Module"""
+
     hmod: Module  # hdl21.Module
     pmod: vckt.Module  # VLSIR Module
 
@@ -81,6 +97,10 @@ class ProtoExporter:
         # ExternalModule-id to Proto-ExternalModule dict
         self.ext_modules: Dict[int, vckt.ExternalModule] = dict()
 
+        # Connection-id to Proto-ConnectionTarget dict.
+        # Commonly-shared Signals (e.g. power and ground) are connected to many Instances, and exported once each.
+        self.conn_targets: Dict[int, vckt.ConnectionTarget] = dict()
+
         # Default `domain` AKA package-name is the empty string
         self.pkg = vckt.Package(domain=domain or "")
 
@@ -135,12 +155,13 @@ class ProtoExporter:
             pmod.ports.append(export_port(port))
 
         # Create each Proto-Instance
+        export_instance = self.export_instance
+        append = pmod.instances.append
         for inst in module.instances.values():
             if not inst._resolved:
                 msg = f"Invalid Instance {inst.name} of unresolved Module in Module {module.name}"
                 raise RuntimeError(msg)
-            pinst = self.export_instance(inst)
-            pmod.instances.append(pinst)
+            append(export_instance(inst))
 
         # Create the Module's `literal`s
         for literal in module.literals:
@@ -193,23 +214,10 @@ class ProtoExporter:
                 elif call.prim.primtype == PrimitiveType.IDEAL:
                     # Ideal elements convert to `vlsir.primitives`
                     pinst.module.external.domain = "vlsir.primitives"
-                    prim_map = {
-                        "DcVoltageSource": "vdc",
-                        "PulseVoltageSource": "vpulse",
-                        "SineVoltageSource": "vsin",
-                        "CurrentSource": "isource",
-                        "IdealResistor": "resistor",
-                        "IdealCapacitor": "capacitor",
-                        "IdealInductor": "inductor",
-                        "VoltageControlledVoltageSource": "vcvs",
-                        "CurrentControlledVoltageSource": "ccvs",
-                        "VoltageControlledCurrentSource": "vccs",
-                        "CurrentControlledCurrentSource": "cccs",
-                    }
-                    if call.prim.name not in prim_map:
+                    if call.prim.name not in _VLSIR_PRIMITIVE_NAMES:
                         msg = f"Invalid Primitive {call.prim.name} in PrimitiveCall {inst.name}"
                         raise RuntimeError(msg)
-                    pinst.module.external.name = prim_map[call.prim.name]
+                    pinst.module.external.name = _VLSIR_PRIMITIVE_NAMES[call.prim.name]
                     params = export_primitive_params(call.params)
                 else:
                     raise ValueError(f"Invalid PrimitiveType {call.prim.primtype}")
@@ -236,16 +244,25 @@ class ProtoExporter:
             raise TypeError(f"Un-exportable Instance {inst} of {inst._resolved}")
 
         # Create its connections mapping
+        # Bind the per-connection methods to locals once, outside the loop
+        export_target = self.export_connection_target
+        append = pinst.connections.append
         for pname, conn in inst.conns.items():
             # Assign each item into the connections dict.
             # The proto interface requires copying it along the way
-            pconn = vckt.Connection(
-                portname=pname, target=export_connection_target(conn)
-            )
-            pinst.connections.append(pconn)
+            append(vckt.Connection(portname=pname, target=export_target(conn)))
 
         return pinst
 
+    def export_connection_target(
+        self, conn: Union[Signal, Slice, Concat]
+    ) -> vckt.ConnectionTarget:
+        """Export a `ConnectionTarget`, or retrieve it if previously exported."""
+        pconn = self.conn_targets.get(id(conn), None)
+        if pconn is None:
+            pconn = self.conn_targets[id(conn)] = export_connection_target(conn)
+        return pconn
+
 
 def export_port(port: Port) -> vckt.Port:
     """Export a `Port`"""
@@ -255,17 +272,21 @@ def export_port(port: Port) -> vckt.Port:
     return pport
 
 
+# Mapping from Hdl21 `PortDir`s to their VLSIR equivalents
+_PORT_DIRS = {
+    PortDir.INPUT: vckt.Port.Direction.INPUT,
+    PortDir.OUTPUT: vckt.Port.Direction.OUTPUT,
+    PortDir.INOUT: vckt.Port.Direction.INOUT,
+    PortDir.NONE: vckt.Port.Direction.NONE,
+}
+
+
 def export_port_dir(port: Port) -> vckt.Port.Direction:
     """Convert between Port-Direction Enumerations"""
-    if port.direction == PortDir.INPUT:
-        return vckt.Port.Direction.INPUT
-    if port.direction == PortDir.OUTPUT:
-        return vckt.Port.Direction.OUTPUT
-    if port.direction == PortDir.INOUT:
-        return vckt.Port.Direction.INOUT
-    if port.direction == PortDir.NONE:
-        return vckt.Port.Direction.NONE
-    raise ValueError(f"Invalid PortDir {port.direction}")
+    pdir = _PORT_DIRS.get(port.direction, None)
+    if pdir is None:
+        raise ValueError(f"Invalid PortDir {port.direction}")
+    return pdir
 
 
 def export_connection_target(
@@ -273,19 +294,17 @@ def export_connection_target(
 ) -> vckt.ConnectionTarget:
     """Export a proto `ConnectionTarget`"""
 
-    pconn = vckt.ConnectionTarget()  # Create a proto-Connection
+    # Each variant creates its proto-Connection in a single constructor call.
+    # Direct connections to full `Signal`s are by far the most common, and are checked first.
     if isinstance(sig, Signal):
-        pconn.sig = sig.name
-    elif isinstance(sig, Slice):
-        pslice = export_slice(sig)
-        pconn.slice.CopyFrom(pslice)
-    elif isinstance(sig, Concat):
-        pconc = export_concat(sig)
-        pconn.concat.CopyFrom(pconc)
-    else:
-        msg = f"Invalid argument to `export_connection_target`: {sig}"
-        raise TypeError(msg)
-    return pconn
+        return vckt.ConnectionTarget(sig=sig.name)
+    if isinstance(sig, Slice):
+        return vckt.ConnectionTarget(slice=export_slice(sig))
+    if isinstance(sig, Concat):
+        return vckt.ConnectionTarget(concat=export_concat(sig))
+
+    msg = f"Invalid argument to `export_connection_target`: {sig}"
+    raise TypeError(msg)
 
 
 def export_slice(slize: Slice) -> vckt.Slice:
@@ -305,10 +324,7 @@ def export_slice(slize: Slice) -> vckt.Slice:
 
 def export_concat(concat: Concat) -> vckt.Concat:
     """Export (potentially recursive) Signal Concatenations"""
-    pconc = vckt.Concat()
-    for part in concat.parts:
-        pconc.parts.append(export_connection_target(part))
-    return pconc
+    return vckt.Concat(parts=[export_connection_target(part) for part in concat.parts])
 
 
 def export_primitive_params(params: Any) -> Dict[str, Optional[Prefixed]]:
@@ -392,34 +408,37 @@ def export_param_value(val: ToVlsirParam) -> Optional[vlsir.ParamValue]:
     raise TypeError(msg)
 
 
+# Mapping from `Prefix` exponents to VLSIR `SIPrefix`es
+_SI_PREFIXES = {
+    -24: vlsir.SIPrefix.YOCTO,
+    -21: vlsir.SIPrefix.ZEPTO,
+    -18: vlsir.SIPrefix.ATTO,
+    -15: vlsir.SIPrefix.FEMTO,
+    -12: vlsir.SIPrefix.PICO,
+    -9: vlsir.SIPrefix.NANO,
+    -6: vlsir.SIPrefix.MICRO,
+    -3: vlsir.SIPrefix.MILLI,
+    -2: vlsir.SIPrefix.CENTI,
+    -1: vlsir.SIPrefix.DECI,
+    0: vlsir.SIPrefix.UNIT,
+    1: vlsir.SIPrefix.DECA,
+    2: vlsir.SIPrefix.HECTO,
+    3: vlsir.SIPrefix.KILO,
+    6: vlsir.SIPrefix.MEGA,
+    9: vlsir.SIPrefix.GIGA,
+    12: vlsir.SIPrefix.TERA,
+    15: vlsir.SIPrefix.PETA,
+    18: vlsir.SIPrefix.EXA,
+    21: vlsir.SIPrefix.ZETTA,
+    24: vlsir.SIPrefix.YOTTA,
+}
+
+
 def export_prefix(pre: Prefix) -> vlsir.SIPrefix:
     """Export an enumerated `Prefix`"""
-    map = {
-        -24: vlsir.SIPrefix.YOCTO,
-        -21: vlsir.SIPrefix.ZEPTO,
-        -18: vlsir.SIPrefix.ATTO,
-        -15: vlsir.SIPrefix.FEMTO,
-        -12: vlsir.SIPrefix.PICO,
-        -9: vlsir.SIPrefix.NANO,
-        -6: vlsir.SIPrefix.MICRO,
-        -3: vlsir.SIPrefix.MILLI,
-        -2: vlsir.SIPrefix.CENTI,
-        -1: vlsir.SIPrefix.DECI,
-        0: vlsir.SIPrefix.UNIT,
-        1: vlsir.SIPrefix.DECA,
-        2: vlsir.SIPrefix.HECTO,
-        3: vlsir.SIPrefix.KILO,
-        6: vlsir.SIPrefix.MEGA,
-        9: vlsir.SIPrefix.GIGA,
-        12: vlsir.SIPrefix.TERA,
-        15: vlsir.SIPrefix.PETA,
-        18: vlsir.SIPrefix.EXA,
-        21: vlsir.SIPrefix.ZETTA,
-        24: vlsir.SIPrefix.YOTTA,
-    }
-    if pre.value not in map:
+    if pre.value not in _SI_PREFIXES:
         raise ValueError(f"Invalid Prefix {pre}")
-    return map[pre.value]
+    return _SI_PREFIXES[pre.value]
 
 
 def export_prefixed(pref: Prefixed) -> vlsir.Prefixed:
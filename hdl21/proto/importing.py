@@ -2,7 +2,7 @@
 hdl21 ProtoBuf Import 
 """
 from types import SimpleNamespace
-from typing import Union, Any, Dict, List, Optional
+from typing import Callable, Union, Any, Dict, List, Optional
 
 # Local imports
 # Proto-definitions
@@ -37,6 +37,7 @@ class ProtoImporter:
         self.pkg = pkg
         self.modules = dict()  # Dict of names to Modules
         self.ext_modules = dict()  # Dict of qual-names to ExternalModules
+        self.primitives = dict()  # Dict of qual-names to resolved Primitives
         self.ns = SimpleNamespace()
         self.ns.name = pkg.domain
 
@@ -118,14 +119,18 @@ class ProtoImporter:
             module.add(inst)
 
             # Make the instance's connections
+            # Note the `ports` property of `Primitive`s and `ExternalModule`s creates a new dictionary on each access.
+            # Grab it once per Instance, rather than once per connection.
+            ports = inst._resolved.ports
             for pconn in pinst.connections:
-                if pconn.portname not in inst._resolved.ports:
-                    msg = f"Invalid Port {pconn.portname} on {inst} in Module {module.name}"
+                portname = pconn.portname
+                if portname not in ports:
+                    msg = f"Invalid Port {portname} on {inst} in Module {module.name}"
                     raise RuntimeError(msg)
                 # Import the Signal-object
                 conn = import_connection_target(pconn.target, module)
                 # And connect it to the Instance
-                inst.connect(pconn.portname, conn)
+                inst.connect(portname, conn)
 
         # Import any literal content
         for plit in pmod.literals:
@@ -142,39 +147,45 @@ class ProtoImporter:
         Connections are *not* performed inside this method."""
 
         # Also a small piece of proof that Google hates Python.
+        # Each protobuf field-access is a comparatively expensive descriptor lookup; grab those we use more than once.
         ref = pinst.module
-        if ref.WhichOneof("to") == "local":
+        to = ref.WhichOneof("to")
+        if to == "local":
             # Internally-defined Module
-            module = self.modules.get(ref.local, None)
+            local = ref.local
+            module = self.modules.get(local, None)
             if module is None:
-                raise RuntimeError(f"Invalid undefined Module {ref.local} ")
+                raise RuntimeError(f"Invalid undefined Module {local} ")
             if len(pinst.parameters):
                 msg = f"Invalid Instance {pinst} with of Module {module} - does not accept Parameters"
                 raise RuntimeError(msg)
             target = module
 
-        elif ref.WhichOneof("to") == "external":  # Defined outside package
+        elif to == "external":  # Defined outside package
+            external = ref.external
+            domain = external.domain
+
             # Import all of its instance parameters to a dict
             params = import_parameters(pinst.parameters)
 
             # First check the priviledged/ internally-defined domains
-            if ref.external.domain == "vlsir.primitives":
+            if domain == "vlsir.primitives":
                 # Import a VLSIR primitive to an ideal element, and convert its parameters
-                target = import_vlsir_primitive(ref.external)
+                target = self.resolve_primitive(external, import_vlsir_primitive)
                 remapped_params = import_primitive_params(target, params)
                 params = target.Params(**remapped_params)
 
-            elif ref.external.domain in (
+            elif domain in (
                 "hdl21.primitives",
                 "hdl21.ideal",
             ):
                 # Retrieve the Primitive from `hdl21.primitives`, and convert its parameters
-                target = import_hdl21_primitive(ref.external)
+                target = self.resolve_primitive(external, import_hdl21_primitive)
                 params = target.Params(**params)
 
             else:  # Externally-defined `ExternalModule`
                 # These must be declared in our `Package` being imported. Look up its header-info from `ext_modules`.
-                key = (ref.external.domain, ref.external.name)
+                key = (domain, external.name)
                 target = self.ext_modules.get(key, None)
                 if target is None:
                     msg = f"Invalid Instance of undefined External Module {key}"
@@ -188,6 +199,20 @@ class ProtoImporter:
 
         return Instance(name=pinst.name, of=target)
 
+    def resolve_primitive(
+        self,
+        pref: vlsir.utils.QualifiedName,
+        importer: Callable[[vlsir.utils.QualifiedName], Primitive],
+    ) -> Primitive:
+        """Resolve the Primitive referred to by `pref`, using the `importer` function.
+        Results are cached by qualified name, so that each distinct Primitive is resolved once per Package,
+        regardless of how many Instances refer to it."""
+        key = (pref.domain, pref.name)
+        prim = self.primitives.get(key, None)
+        if prim is None:
+            prim = self.primitives[key] = importer(pref)
+        return prim
+
 
 def import_ports_and_signals(
     pmod: Union[vckt.Module, vckt.ExternalModule]
@@ -204,11 +229,13 @@ def import_ports_and_signals(
     # Convert the entries of `signals` that are ports
     for pport in pmod.ports:
         dir_ = import_port_dir(pport)
-        if pport.signal not in signals:
+        # Look up the port's Signal once, rather than re-indexing `signals` per attribute
+        sig = signals.get(pport.signal, None)
+        if sig is None:
             msg = f"Port {pport} missing Signal in {signals}"
             raise RuntimeError(msg)
-        signals[pport.signal].direction = dir_
-        signals[pport.signal].vis = Visibility.PORT
+        sig.direction = dir_
+        sig.vis = Visibility.PORT
 
     return list(signals.values())
 
@@ -226,32 +253,34 @@ def import_hdl21_primitive(pref: vlsir.utils.QualifiedName) -> Primitive:
     return prim
 
 
+# Mapping from `vlsir.primitives` to Hdl21's ideal elements
+# FIXME: specialized importing of their parameters!
+_HDL21_PRIMITIVE_NAMES = {
+    "vdc": "DcVoltageSource",
+    "vpulse": "PulseVoltageSource",
+    "vsin": "SineVoltageSource",
+    "isource": "CurrentSource",
+    "resistor": "IdealResistor",
+    "capacitor": "IdealCapacitor",
+    "inductor": "IdealInductor",
+    "vcvs": "VoltageControlledVoltageSource",
+    "vccs": "VoltageControlledCurrentSource",
+    "ccvs": "CurrentControlledVoltageSource",
+    "cccs": "CurrentControlledCurrentSource",
+}
+
+
 def import_vlsir_primitive(pref: vlsir.utils.QualifiedName) -> Primitive:
     """Import a VLSIR-defined Primitive"""
     if pref.domain != "vlsir.primitives":
         raise ValueError(f"Invalid Primitive Domain: {pref.domain}")
 
-    # Mapping from `vlsir.primitives` to Hdl21's ideal elements
-    # FIXME: specialized importing of their parameters!
-    prim_map = {
-        "vdc": "DcVoltageSource",
-        "vpulse": "PulseVoltageSource",
-        "vsin": "SineVoltageSource",
-        "isource": "CurrentSource",
-        "resistor": "IdealResistor",
-        "capacitor": "IdealCapacitor",
-        "inductor": "IdealInductor",
-        "vcvs": "VoltageControlledVoltageSource",
-        "vccs": "VoltageControlledCurrentSource",
-        "ccvs": "CurrentControlledVoltageSource",
-        "cccs": "CurrentControlledCurrentSource",
-    }
-    if pref.name not in prim_map:
+    if pref.name not in _HDL21_PRIMITIVE_NAMES:
         msg = f"Invalid or unsupported VLSIR Primitive: {pref.name}"
         raise RuntimeError(msg)
 
     # Get the Hdl21 Primitive class
-    prim = getattr(primitives, prim_map[pref.name], None)
+    prim = getattr(primitives, _HDL21_PRIMITIVE_NAMES[pref.name], None)
     if not isinstance(prim, Primitive):
         msg = f"Attempt to import invalid `hdl21.primitive` {pref.external.name}"
         raise RuntimeError(msg)
@@ -314,54 +343,57 @@ def import_connection_target(
 
 def import_concat(pconc: vckt.Concat, module: Module) -> Concat:
     """Import a (potentially nested) Concatenation"""
-    parts = []
-    for ppart in pconc.parts:
-        part = import_connection_target(ppart, module)
-        parts.append(part)
-    return Concat(*parts)
+    return Concat(*[import_connection_target(ppart, module) for ppart in pconc.parts])
+
+
+# Mapping from VLSIR Port-Directions to Hdl21 `PortDir`s
+_PORT_DIRS = {
+    vckt.Port.Direction.INPUT: PortDir.INPUT,
+    vckt.Port.Direction.OUTPUT: PortDir.OUTPUT,
+    vckt.Port.Direction.INOUT: PortDir.INOUT,
+    vckt.Port.Direction.NONE: PortDir.NONE,
+}
 
 
 def import_port_dir(pport: vckt.Port) -> PortDir:
     """Convert between Port-Direction Enumerations"""
-    if pport.direction == vckt.Port.Direction.INPUT:
-        return PortDir.INPUT
-    if pport.direction == vckt.Port.Direction.OUTPUT:
-        return PortDir.OUTPUT
-    if pport.direction == vckt.Port.Direction.INOUT:
-        return PortDir.INOUT
-    if pport.direction == vckt.Port.Direction.NONE:
-        return PortDir.NONE
-    raise ValueError
+    dir_ = _PORT_DIRS.get(pport.direction, None)
+    if dir_ is None:
+        raise ValueError
+    return dir_
+
+
+# Mapping from VLSIR `SIPrefix`es to Hdl21 `Prefix`es
+_PREFIXES = {
+    vlsir.SIPrefix.YOCTO: Prefix.YOCTO,
+    vlsir.SIPrefix.ZEPTO: Prefix.ZEPTO,
+    vlsir.SIPrefix.ATTO: Prefix.ATTO,
+    vlsir.SIPrefix.FEMTO: Prefix.FEMTO,
+    vlsir.SIPrefix.PICO: Prefix.PICO,
+    vlsir.SIPrefix.NANO: Prefix.NANO,
+    vlsir.SIPrefix.MICRO: Prefix.MICRO,
+    vlsir.SIPrefix.MILLI: Prefix.MILLI,
+    vlsir.SIPrefix.CENTI: Prefix.CENTI,
+    vlsir.SIPrefix.DECI: Prefix.DECI,
+    vlsir.SIPrefix.DECA: Prefix.DECA,
+    vlsir.SIPrefix.HECTO: Prefix.HECTO,
+    vlsir.SIPrefix.KILO: Prefix.KILO,
+    vlsir.SIPrefix.MEGA: Prefix.MEGA,
+    vlsir.SIPrefix.GIGA: Prefix.GIGA,
+    vlsir.SIPrefix.TERA: Prefix.TERA,
+    vlsir.SIPrefix.PETA: Prefix.PETA,
+    vlsir.SIPrefix.EXA: Prefix.EXA,
+    vlsir.SIPrefix.ZETTA: Prefix.ZETTA,
+    vlsir.SIPrefix.YOTTA: Prefix.YOTTA,
+    vlsir.SIPrefix.UNIT: Prefix.UNIT,  # Welcome to the party, as of version 2.0!
+}
 
 
 def import_prefix(vpre: vlsir.SIPrefix) -> Prefix:
     """Import an enumerated `Prefix`"""
-    map = {
-        vlsir.SIPrefix.YOCTO: Prefix.YOCTO,
-        vlsir.SIPrefix.ZEPTO: Prefix.ZEPTO,
-        vlsir.SIPrefix.ATTO: Prefix.ATTO,
-        vlsir.SIPrefix.FEMTO: Prefix.FEMTO,
-        vlsir.SIPrefix.PICO: Prefix.PICO,
-        vlsir.SIPrefix.NANO: Prefix.NANO,
-        vlsir.SIPrefix.MICRO: Prefix.MICRO,
-        vlsir.SIPrefix.MILLI: Prefix.MILLI,
-        vlsir.SIPrefix.CENTI: Prefix.CENTI,
-        vlsir.SIPrefix.DECI: Prefix.DECI,
-        vlsir.SIPrefix.DECA: Prefix.DECA,
-        vlsir.SIPrefix.HECTO: Prefix.HECTO,
-        vlsir.SIPrefix.KILO: Prefix.KILO,
-        vlsir.SIPrefix.MEGA: Prefix.MEGA,
-        vlsir.SIPrefix.GIGA: Prefix.GIGA,
-        vlsir.SIPrefix.TERA: Prefix.TERA,
-        vlsir.SIPrefix.PETA: Prefix.PETA,
-        vlsir.SIPrefix.EXA: Prefix.EXA,
-        vlsir.SIPrefix.ZETTA: Prefix.ZETTA,
-        vlsir.SIPrefix.YOTTA: Prefix.YOTTA,
-        vlsir.SIPrefix.UNIT: Prefix.UNIT,  # Welcome to the party, as of version 2.0!
-    }
-    if vpre not in map:
+    if vpre not in _PREFIXES:
         raise ValueError(f"Invalid Prefix {vpre}")
-    return map[vpre]
+    return _PREFIXES[vpre]
 
 
 def import_prefixed(vpref: vlsir.Prefixed) -> Prefixed:
@@ -626,3 +626,33 @@ def test_external_module_to_vlsir():
     pmod = h.proto.export_external_module(emod)
     assert isinstance(pmod, vlsir.circuit.ExternalModule)
     # FIXME: some better tests
+
+
+def test_export_shared_connections():
+    """Test exporting Signals, Slices and Concats shared across several Instances"""
+
+    @h.module
+    class Inner:
+        a = h.Input()
+        b = h.Input(width=2)
+        c = h.Input(width=3)
+
+    @h.module
+    class Outer:
+        x = h.Signal()
+        y = h.Signal(width=4)
+        b = y[1:3]
+        c = h.Concat(x, y[0:2])
+        i0 = Inner(a=x, b=b, c=c)
+        i1 = Inner(a=x, b=b, c=c)
+
+    ppkg = h.to_proto(Outer)
+    pouter = ppkg.modules[-1]
+    assert pouter.name == "hdl21.tests.test_exports.Outer"
+    assert len(pouter.instances) == 2
+    i0, i1 = pouter.instances
+    assert list(i0.connections) == list(i1.connections)
+    conns = {c.portname: c.target for c in i0.connections}
+    assert conns["a"] == vlsir.circuit.ConnectionTarget(sig="x")
+    assert conns["b"].slice == vlsir.circuit.Slice(signal="y", top=2, bot=1)
+    assert len(conns["c"].concat.parts) == 2